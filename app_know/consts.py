@@ -1,11 +1,31 @@
 """Constants for app_know."""
+from functools import lru_cache
+from typing import Any, Optional
+
 
 # Default app ID (used when not specified)
 APP_ID_DEFAULT = 0
 
 
-def validate_app_id(app_id, default=None) -> int:
+@lru_cache(maxsize=256)
+def _coerce_app_id_str(s: str) -> Optional[int]:
+    """Parse a stripped app_id string; None for blank. Cached: app_ids come from a small set."""
+    if not s:
+        return None
+    try:
+        val = int(s)
+    except ValueError:
+        val = -1
+    # Negative strings keep the historical "must be an integer" message
+    if val < 0:
+        raise ValueError("app_id must be an integer")
+    return val
+
+
+def validate_app_id(app_id: Any, default: Optional[int] = None) -> int:
     """Validate and return app_id as integer. 0 is valid."""
+    if type(app_id) is int and app_id >= 0:
+        return app_id
     dflt = default if default is not None else APP_ID_DEFAULT
     if app_id is None:
         return dflt
@@ -14,23 +34,15 @@ def validate_app_id(app_id, default=None) -> int:
             raise ValueError("app_id must be a non-negative integer")
         return app_id
     if isinstance(app_id, str):
-        s = app_id.strip()
-        if not s:
-            return dflt
-        try:
-            val = int(s)
-            if val < 0:
-                raise ValueError("app_id must be a non-negative integer")
-            return val
-        except ValueError:
-            raise ValueError("app_id must be an integer")
+        val = _coerce_app_id_str(app_id.strip())
+        return dflt if val is None else val
     try:
         val = int(app_id)
-        if val < 0:
-            raise ValueError("app_id must be a non-negative integer")
-        return val
     except (TypeError, ValueError):
+        val = -1
+    if val < 0:
         raise ValueError("app_id must be an integer")
+    return val
 
 
 # Sentence classification (Claim / Fact / Event / Concept / Definition / Argument)
@@ -30,6 +30,7 @@ from app_know.repos.knowledge_entity_compat import (
     delete_knowledge,
     get_knowledge_by_id,
     get_knowledge_by_ids,
+    get_knowledge_fields,
     list_knowledge,
     update_knowledge,
 )
@@ -41,6 +42,7 @@ __all__ = [
     "get_batch_as_entity",
     "get_knowledge_by_id",
     "get_knowledge_by_ids",
+    "get_knowledge_fields",
     "list_knowledge",
     "create_knowledge",
     "update_knowledge",
@@ -9,9 +9,13 @@ import logging
 from types import SimpleNamespace
 from typing import Any, List, Optional, Tuple
 
+from django.db.models import TextField, Value
+from django.db.models.functions import Coalesce
+
 from app_know.models import Batch, KnowledgePoint
 from app_know.repos.batch_repo import create_batch, delete_batch, update_content
 from app_know.repos.knowledge_point_repo import (
+    batch_title,
     delete_by_batch,
     get_batch_as_entity,
     list_by_batch,
@@ -25,6 +29,9 @@ logger = logging.getLogger(__name__)
 
 _DB = "know_rw"
 
+# Max knowledge points concatenated into one batch entity's content
+_ENTITY_MAX_POINTS = 5000
+
 
 def _dict_to_entity(d: dict[str, Any]) -> SimpleNamespace:
     return SimpleNamespace(**d)
@@ -37,6 +44,24 @@ def get_knowledge_by_id(entity_id: Any) -> Optional[SimpleNamespace]:
     return _dict_to_entity(d) if d else None
 
 
+def get_knowledge_fields(entity_id: Any) -> Optional[Tuple[str, str, str, str]]:
+    """
+    (title, description, content, source_type) for entity_id, as get_knowledge_by_id would build them.
+    Selects only COALESCE(content, '') per point, so no KnowledgePoint rows are hydrated.
+    """
+    if entity_id is None or not isinstance(entity_id, int) or entity_id <= 0:
+        return None
+    contents = list(
+        KnowledgePoint.objects.using(_DB)
+        .filter(batch_id=entity_id)
+        .order_by("seq")
+        .values_list(Coalesce("content", Value(""), output_field=TextField()), flat=True)[:_ENTITY_MAX_POINTS]
+    )
+    if not contents:
+        return None
+    return batch_title(entity_id, contents[0]), "", "\n".join(contents), "batch"
+
+
 def get_knowledge_by_ids(ids: List[int]) -> List[SimpleNamespace]:
     if not ids:
         return []
@@ -75,6 +75,11 @@ def batch_create(
     return result
 
 
+def batch_title(batch_id: int, first_content: Optional[str]) -> str:
+    """Entity title for a batch: first point's content cut to 80 chars, or "Batch <id>" if empty."""
+    return first_content[:80] if first_content else f"Batch {batch_id}"
+
+
 def get_batch_as_entity(batch_id: int) -> Optional[dict]:
     """Return batch as entity-like dict (id, title, content) for backward compat."""
     items, _ = list_by_batch(batch_id, limit=5000)
@@ -84,7 +89,7 @@ def get_batch_as_entity(batch_id: int) -> Optional[dict]:
     first = items[0]
     return {
         "id": batch_id,
-        "title": (first.content or "")[:80] if first.content else f"Batch {batch_id}",
+        "title": batch_title(batch_id, first.content),
         "description": "",
         "content": content,
         "source_type": "batch",
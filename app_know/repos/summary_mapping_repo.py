@@ -32,5 +32,9 @@ def delete_mapping_by_knowledge_id(knowledge_id: int, app_id: Optional[int] = No
     raise RuntimeError(_NOT_AVAILABLE)
 
 
+def delete_mapping_by_knowledge_ids(knowledge_ids: List[int], app_id: Optional[int] = None) -> int:
+    raise RuntimeError(_NOT_AVAILABLE)
+
+
 def get_knowledge_ids_by_summary_ids(summary_ids: List[str], app_id: Optional[int] = None) -> List[int]:
     raise RuntimeError(_NOT_AVAILABLE)
@@ -23,9 +23,11 @@ def save_summary(
         knowledge_id: int,
         summary: str,
         app_id: int,
+        content_hash: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     No-op: knowledge_summaries disabled. Validates inputs, returns stub.
+    content_hash identifies the source fields the summary was generated from.
     """
     if knowledge_id is None or not isinstance(knowledge_id, int) or knowledge_id <= 0:
         raise ValueError("knowledge_id must be a positive integer")
@@ -39,7 +41,15 @@ def save_summary(
         raise ValueError("app_id is required and must be a non-negative integer")
     now_ms = get_now_timestamp_ms()
     logger.info("[summary_repo] knowledge_summaries disabled, save_summary no-op for kid=%s", knowledge_id)
-    return {"id": None, "kid": knowledge_id, "summary": summary, "app_id": app_id, "ct": now_ms, "ut": now_ms}
+    return {
+        "id": None,
+        "kid": knowledge_id,
+        "summary": summary,
+        "app_id": app_id,
+        "content_hash": content_hash,
+        "ct": now_ms,
+        "ut": now_ms,
+    }
 
 
 def get_summary(
@@ -83,6 +93,13 @@ def delete_by_knowledge_id(knowledge_id: int) -> int:
     return 0
 
 
+def delete_by_knowledge_ids(knowledge_ids: List[int]) -> int:
+    """
+    No-op: knowledge_summaries disabled. Returns 0.
+    """
+    return 0
+
+
 def update_summary(
         knowledge_id: int,
         app_id: int,
@@ -3,7 +3,7 @@ Python-based knowledge summary generation from title/description/content.
 AI path uses app_aibroker over HTTP only (no in-process OpenAI client).
 """
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 from common.consts.string_const import EMPTY_STRING
 
@@ -14,6 +14,10 @@ SUMMARY_MAX_LEN = 2000
 
 SUMMARY_QUESTION = "generate a concise summary capturing the key points and main ideas in 1 sentence, written in English."
 
+# Which path produced a summary (see generate_summary_with_source)
+SUMMARY_SOURCE_AI = "ai"
+SUMMARY_SOURCE_RULE = "rule"
+
 
 def generate_summary(
         title: str,
@@ -25,6 +29,29 @@ def generate_summary(
 ) -> str:
     """
     Generate a short summary from title, description, and optional content.
+    See generate_summary_with_source for arguments and errors.
+    """
+    summary, _ = generate_summary_with_source(
+        title,
+        description=description,
+        content=content,
+        source_type=source_type,
+        max_length=max_length,
+        use_ai=use_ai,
+    )
+    return summary
+
+
+def generate_summary_with_source(
+        title: str,
+        description: Optional[str] = None,
+        content: Optional[str] = None,
+        source_type: Optional[str] = None,
+        max_length: int = SUMMARY_MAX_LEN,
+        use_ai: bool = False,
+) -> Tuple[str, str]:
+    """
+    Generate a short summary and report which path produced it.
 
     Args:
         title: Knowledge title (required)
@@ -35,7 +62,8 @@ def generate_summary(
         use_ai: If True, use app_aibroker for generation; falls back to rule-based if broker fails
 
     Returns:
-        Generated summary string
+        (summary, source): source is SUMMARY_SOURCE_AI only when the broker produced the text,
+        SUMMARY_SOURCE_RULE otherwise (including the fallback after a broker failure)
 
     Raises:
         ValueError: If title is missing or invalid, or max_length invalid
@@ -55,10 +83,10 @@ def generate_summary(
     if use_ai:
         ai_summary = _generate_summary_with_ai(title, desc, cnt, st, max_length)
         if ai_summary:
-            return ai_summary
+            return ai_summary, SUMMARY_SOURCE_AI
         logger.info("[summary_generator] AI generation failed, falling back to rule-based")
 
-    return _generate_summary_rule_based(title, desc, cnt, st, max_length)
+    return _generate_summary_rule_based(title, desc, cnt, st, max_length), SUMMARY_SOURCE_RULE
 
 
 def _generate_summary_with_ai(
@@ -105,6 +133,10 @@ def _generate_summary_rule_based(
         max_length: int,
 ) -> str:
     """Generate summary using rule-based concatenation."""
+    # Only the first max_length chars can survive truncation; clip before formatting so a
+    # large batch content is not copied in full just to be sliced away.
+    description = description[:max_length]
+    content = content[:max_length]
     parts = [f"Title: {title}"]
     if description:
         parts.append(f"Description: {description}")
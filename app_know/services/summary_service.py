@@ -2,89 +2,81 @@
 Summary service: generate and persist knowledge summaries; keep in sync with knowledge. Generated.
 """
 import logging
-from typing import Any, Dict, Optional
-
-from app_know.repos.knowledge_point_repo import get_batch_as_entity
-
-
-def _get_knowledge_as_entity(entity_id):
-    d = get_batch_as_entity(entity_id)
-    if d is None:
-        return None
-
-    class _Entity:
-        pass
-
-    e = _Entity()
-    for k, v in d.items():
-        setattr(e, k, v)
-    return e
-
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
 
+from app_know.consts import validate_app_id as _validate_app_id
+from app_know.repos import get_knowledge_fields
 from app_know.repos.summary_mapping_repo import (
     create_or_update_mapping,
     delete_mapping_by_knowledge_id,
+    delete_mapping_by_knowledge_ids,
 )
 from app_know.repos.summary_repo import (
-    delete_by_knowledge_id,
+    delete_by_knowledge_ids,
     delete_summary as repo_delete_summary,
     get_summary as repo_get_summary,
     list_summaries as repo_list_summaries,
     save_summary,
     update_summary as repo_update_summary,
 )
-from app_know.services.summary_generator import generate_summary
+from app_know.services.summary_generator import (
+    SUMMARY_MAX_LEN,
+    SUMMARY_QUESTION,
+    SUMMARY_SOURCE_AI,
+    SUMMARY_SOURCE_RULE,
+    generate_summary_with_source,
+)
 from common.components.singleton import Singleton
 from common.consts.query_const import LIMIT_LIST
+from common.utils.hash_util import md5
 
 logger = logging.getLogger(__name__)
 
+# Max knowledge_ids per batched delete: keeps IN (...) placeholders and $in command size bounded
+DELETE_BATCH_SIZE = 1000
+
 
-def _validate_knowledge_id(knowledge_id) -> None:
+def _validate_knowledge_id(knowledge_id: Any) -> int:
+    """Validate and return knowledge_id as a positive integer. Raises ValueError if invalid."""
+    t = type(knowledge_id)
+    if t is int:
+        if knowledge_id <= 0:
+            raise ValueError("knowledge_id must be a positive integer")
+        return knowledge_id
     if knowledge_id is None:
         raise ValueError("knowledge_id is required")
-    if not isinstance(knowledge_id, int):
-        try:
-            knowledge_id = int(knowledge_id)
-        except (TypeError, ValueError):
-            raise ValueError("knowledge_id must be an integer")
-    if knowledge_id <= 0:
+    if t is bool:
+        raise ValueError("knowledge_id must be an integer")
+    try:
+        val = int(knowledge_id)
+    except (TypeError, ValueError):
+        raise ValueError("knowledge_id must be an integer")
+    if val <= 0:
         raise ValueError("knowledge_id must be a positive integer")
+    return val
 
 
-def _validate_app_id(app_id, default=None) -> int:
-    """Validate and return app_id as integer. 0 is valid (default). Raises ValueError if invalid."""
-    from app_know.consts import APP_ID_DEFAULT
-    dflt = default if default is not None else APP_ID_DEFAULT
-    if app_id is None:
-        return dflt
-    if isinstance(app_id, int):
-        if app_id < 0:
-            raise ValueError("app_id must be a non-negative integer")
-        return app_id
-    if isinstance(app_id, str):
-        s = app_id.strip()
-        if not s:
-            return dflt
-        try:
-            val = int(s)
-            if val < 0:
-                raise ValueError("app_id must be a non-negative integer")
-            return val
-        except ValueError:
-            raise ValueError("app_id must be an integer")
-    try:
-        val = int(app_id)
-        if val < 0:
-            raise ValueError("app_id must be a non-negative integer")
-        return val
-    except (TypeError, ValueError):
-        raise ValueError("app_id must be an integer")
+def _content_hash(title: str, description: str, content: str, source_type: str, source: str) -> str:
+    """
+    Hash of the generator inputs and config for the path (SUMMARY_SOURCE_AI/RULE) that produced
+    the summary; an unchanged hash means regeneration on that path would be a no-op.
+    """
+    parts = [title, description, content, source_type, source, str(SUMMARY_MAX_LEN)]
+    if source == SUMMARY_SOURCE_AI:
+        parts.append(SUMMARY_QUESTION)
+    return md5("\x1f".join(parts))
 
 
 class SummaryService(Singleton):
     """Service for generating and persisting knowledge summaries (MongoDB)."""
 
+    def __init__(self):
+        # In-flight generate_and_save calls keyed by (knowledge_id, app_id, use_ai)
+        self._inflight: Dict[Tuple[int, int, bool], Future] = {}
+        self._inflight_lock = threading.Lock()
+
     def generate_and_save(
             self,
             knowledge_id: int,
@@ -100,41 +92,85 @@ class SummaryService(Singleton):
             app_id: Application ID (int, 0 for default)
             use_ai: If True, use app_aibroker (HTTP) for AI-powered generation
 
+        Concurrent calls for the same (knowledge_id, app_id, use_ai) are coalesced:
+        followers wait for the in-flight call and share its result (or exception).
+
         Raises:
             ValueError: If knowledge_id or app_id invalid, or knowledge not found
         """
-        _validate_knowledge_id(knowledge_id)
+        knowledge_id = _validate_knowledge_id(knowledge_id)
         app_id = _validate_app_id(app_id)
-        logger.info(
-            "[generate_and_save] Starting for knowledge_id=%s, app_id=%s, use_ai=%s",
-            knowledge_id, app_id, use_ai
-        )
-        entity = _get_knowledge_as_entity(knowledge_id)
-        if not entity:
+        key = (knowledge_id, app_id, bool(use_ai))
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+        if not is_leader:
+            return future.result()
+        try:
+            result = self._generate_and_save(knowledge_id, app_id, use_ai)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        future.set_result(result)
+        return result
+
+    def _generate_and_save(self, knowledge_id: int, app_id: int, use_ai: bool) -> Dict[str, Any]:
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "[generate_and_save] Starting for knowledge_id=%s, app_id=%s, use_ai=%s",
+                knowledge_id, app_id, use_ai
+            )
+        row = get_knowledge_fields(knowledge_id)
+        if row is None:
             raise ValueError(f"Knowledge entity with id {knowledge_id} not found")
-        title = entity.title or ""
-        description = entity.description or ""
-        content = getattr(entity, "content", None) or ""
-        source_type = getattr(entity, "source_type", None) or ""
-        logger.info(
-            "[generate_and_save] Generating summary for title: %s",
-            title[:50] if title else "(empty)"
-        )
-        summary_text = generate_summary(
+        title, description, content, source_type = row
+        requested_source = SUMMARY_SOURCE_AI if use_ai else SUMMARY_SOURCE_RULE
+        try:
+            existing = repo_get_summary(knowledge_id=knowledge_id, app_id=app_id)
+        except Exception as e:
+            logger.warning(
+                "[generate_and_save] Failed to load existing summary for knowledge_id=%s: %s",
+                knowledge_id, e
+            )
+            existing = None
+        # A rule-based fallback is stored under the rule hash, so it never satisfies a use_ai request
+        if existing and existing.get("content_hash") == _content_hash(
+                title, description, content, source_type, requested_source):
+            if log_info:
+                logger.info(
+                    "[generate_and_save] Source unchanged for knowledge_id=%s, keeping existing summary",
+                    knowledge_id
+                )
+            return existing
+        if log_info:
+            logger.info(
+                "[generate_and_save] Generating summary for title: %s",
+                title[:50] if title else "(empty)"
+            )
+        summary_text, source = generate_summary_with_source(
             title=title,
             description=description,
             content=content,
             source_type=source_type,
             use_ai=use_ai,
         )
-        logger.info(
-            "[generate_and_save] Summary generated, length=%d, saving to Atlas",
-            len(summary_text)
-        )
+        if log_info:
+            logger.info(
+                "[generate_and_save] Summary generated, length=%d, saving to Atlas",
+                len(summary_text)
+            )
         result = save_summary(
             knowledge_id=knowledge_id,
             summary=summary_text,
             app_id=app_id,
+            content_hash=_content_hash(title, description, content, source_type, source),
         )
         summary_id = result.get("id")
         if summary_id:
@@ -157,7 +193,7 @@ class SummaryService(Singleton):
             app_id: Optional[int] = None,
     ) -> Optional[Dict[str, Any]]:
         """Get one summary by knowledge_id, optionally filtered by app_id."""
-        _validate_knowledge_id(knowledge_id)
+        knowledge_id = _validate_knowledge_id(knowledge_id)
         return repo_get_summary(knowledge_id=knowledge_id, app_id=app_id)
 
     def list_summaries(
@@ -189,7 +225,8 @@ class SummaryService(Singleton):
             offset=offset,
             limit=limit,
         )
-        next_offset = offset + len(items) if (offset + len(items)) < total else None
+        end = offset + len(items)
+        next_offset = end if end < total else None
         return {
             "data": items,
             "total_num": total,
@@ -206,7 +243,7 @@ class SummaryService(Singleton):
         Update an existing summary. summary must be provided.
         Raises ValueError if not found or invalid input.
         """
-        _validate_knowledge_id(knowledge_id)
+        knowledge_id = _validate_knowledge_id(knowledge_id)
         app_id = _validate_app_id(app_id)
         if summary is None:
             raise ValueError("summary must be provided")
@@ -229,7 +266,7 @@ class SummaryService(Singleton):
         Also deletes the MySQL mapping.
         Raises ValueError if not found.
         """
-        _validate_knowledge_id(knowledge_id)
+        knowledge_id = _validate_knowledge_id(knowledge_id)
         app_id = _validate_app_id(app_id)
         deleted = repo_delete_summary(knowledge_id=knowledge_id, app_id=app_id)
         if not deleted:
@@ -249,14 +286,26 @@ class SummaryService(Singleton):
         Also deletes the MySQL mappings.
         Returns number of summaries deleted. Does not raise if knowledge_id invalid (returns 0).
         """
-        if knowledge_id is None or not isinstance(knowledge_id, int) or knowledge_id <= 0:
+        if type(knowledge_id) is not int or knowledge_id <= 0:
             return 0
-        count = delete_by_knowledge_id(knowledge_id=knowledge_id)
-        try:
-            delete_mapping_by_knowledge_id(knowledge_id=knowledge_id)
-        except Exception as e:
-            logger.warning(
-                "[delete_summaries_for_knowledge] Failed to delete mappings for knowledge_id=%s: %s",
-                knowledge_id, e
-            )
+        return self.delete_summaries_for_knowledges([knowledge_id])
+
+    def delete_summaries_for_knowledges(self, knowledge_ids: List[int]) -> int:
+        """
+        Delete all summaries for the given knowledge_ids, one batched delete per DELETE_BATCH_SIZE ids.
+        Also deletes the MySQL mappings (best-effort, like delete_summary).
+        Returns number of summaries deleted. Invalid ids are skipped.
+        """
+        ids = [k for k in knowledge_ids or () if type(k) is int and k > 0]
+        count = 0
+        for i in range(0, len(ids), DELETE_BATCH_SIZE):
+            batch = ids[i:i + DELETE_BATCH_SIZE]
+            count += delete_by_knowledge_ids(knowledge_ids=batch)
+            try:
+                delete_mapping_by_knowledge_ids(knowledge_ids=batch)
+            except Exception as e:
+                logger.warning(
+                    "[delete_summaries_for_knowledges] Failed to delete mappings for %d knowledge_ids: %s",
+                    len(batch), e
+                )
         return count
@@ -0,0 +1,25 @@
+from unittest import TestCase
+
+from app_know.consts import APP_ID_DEFAULT, validate_app_id
+
+
+class TestValidateAppId(TestCase):
+    def test_valid_values(self):
+        for app_id, expected in ((0, 0), (7, 7), ("7", 7), (" 7 ", 7), (None, APP_ID_DEFAULT), ("", APP_ID_DEFAULT)):
+            with self.subTest(app_id=app_id):
+                self.assertEqual(validate_app_id(app_id), expected)
+
+    def test_default_used_for_blank(self):
+        self.assertEqual(validate_app_id(None, default=5), 5)
+        self.assertEqual(validate_app_id("  ", default=5), 5)
+
+    def test_negative_int_message(self):
+        with self.assertRaisesRegex(ValueError, "^app_id must be a non-negative integer$"):
+            validate_app_id(-2)
+
+    def test_non_int_input_message(self):
+        """Negative strings and floats keep the original "must be an integer" message."""
+        for app_id in ("-2", "abc", -2.0, object()):
+            with self.subTest(app_id=app_id):
+                with self.assertRaisesRegex(ValueError, "^app_id must be an integer$"):
+                    validate_app_id(app_id)
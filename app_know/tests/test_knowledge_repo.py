@@ -1,20 +1,32 @@
 """
 Tests for knowledge_entity_compat repo (CRUD facade over Batch + KnowledgePoint).
 """
-from django.test import TestCase
+from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
 from app_know.repos import (
     get_knowledge_by_id,
+    get_knowledge_fields,
     list_knowledge,
     create_knowledge,
     update_knowledge,
     delete_knowledge,
 )
+from app_know.repos.knowledge_entity_compat import _ENTITY_MAX_POINTS
 from common.consts.query_const import LIMIT_LIST
-from common.utils.date_util import get_now_timestamp_ms
 
 _COMPAT = "app_know.repos.knowledge_entity_compat"
+_FIXED_UT = 1_700_000_000_000
+
+
+def _make_mock_qs(rows, count):
+    """Chainable queryset mock: order_by/filter return itself, slicing returns rows."""
+    qs = MagicMock()
+    qs.order_by.return_value = qs
+    qs.filter.return_value = qs
+    qs.count.return_value = count
+    qs.__getitem__ = lambda _self, s: rows[s]
+    return qs
 
 
 class KnowledgeRepoTest(TestCase):
@@ -74,19 +86,33 @@ class KnowledgeRepoTest(TestCase):
         mock_as_entity.return_value = None
         self.assertIsNone(get_knowledge_by_id(99999))
 
+    @patch(f"{_COMPAT}.KnowledgePoint")
+    def test_get_knowledge_fields(self, mock_point_model):
+        mock_qs = _make_mock_qs([], 0)
+        mock_qs.values_list.return_value.__getitem__.return_value = ["First point", "", "Third"]
+        mock_point_model.objects.using.return_value = mock_qs
+
+        row = get_knowledge_fields(1)
+        self.assertEqual(row, ("First point", "", "First point\n\nThird", "batch"))
+        mock_qs.filter.assert_called_once_with(batch_id=1)
+        # Content is capped at the first _ENTITY_MAX_POINTS points, sliced in SQL
+        mock_qs.values_list.return_value.__getitem__.assert_called_once_with(slice(None, _ENTITY_MAX_POINTS))
+
+    @patch(f"{_COMPAT}.KnowledgePoint")
+    def test_get_knowledge_fields_not_found(self, mock_point_model):
+        mock_qs = _make_mock_qs([], 0)
+        mock_qs.values_list.return_value.__getitem__.return_value = []
+        mock_point_model.objects.using.return_value = mock_qs
+
+        self.assertIsNone(get_knowledge_fields(99999))
+        self.assertIsNone(get_knowledge_fields(0))
+        self.assertIsNone(get_knowledge_fields("1"))
+
     @patch(f"{_COMPAT}.Batch")
     def test_list_knowledge(self, mock_batch_model):
         mock_b = MagicMock()
         mock_b.id = 1
-        mock_qs = MagicMock()
-        mock_qs.order_by.return_value = mock_qs
-        mock_qs.count.return_value = 3
-        def _getitem(_self, s):
-            rows = [mock_b, mock_b, mock_b]
-            return rows[s] if isinstance(s, int) else rows[s]
-
-        mock_qs.__getitem__ = _getitem
-        mock_batch_model.objects.using.return_value = mock_qs
+        mock_batch_model.objects.using.return_value = _make_mock_qs([mock_b, mock_b, mock_b], 3)
 
         with patch(f"{_COMPAT}.get_batch_as_entity") as mock_as_entity:
             mock_as_entity.side_effect = lambda bid: {
@@ -106,15 +132,7 @@ class KnowledgeRepoTest(TestCase):
     def test_list_knowledge_with_source_type_filter(self, mock_batch_model):
         mock_b = MagicMock()
         mock_b.id = 3
-        mock_qs = MagicMock()
-        mock_qs.order_by.return_value = mock_qs
-        mock_qs.filter.return_value = mock_qs
-        mock_qs.count.return_value = 1
-        def _getitem(_self, s):
-            rows = [mock_b]
-            return rows[s] if isinstance(s, int) else rows[s]
-
-        mock_qs.__getitem__ = _getitem
+        mock_qs = _make_mock_qs([mock_b], 1)
         mock_batch_model.objects.using.return_value = mock_qs
 
         with patch(f"{_COMPAT}.get_batch_as_entity") as mock_as_entity:
@@ -129,6 +147,7 @@ class KnowledgeRepoTest(TestCase):
             }
             items, total = list_knowledge(offset=0, limit=10, source_type="url")
         self.assertEqual(total, 1)
+        self.assertEqual([e.source_type for e in items], ["url"])
         mock_qs.filter.assert_called()
 
     @patch(f"{_COMPAT}.update_content")
@@ -147,9 +166,10 @@ class KnowledgeRepoTest(TestCase):
         mock_entity.description = ""
         mock_entity.content = ""
 
-        n = update_knowledge(mock_entity, title="Updated", ut=get_now_timestamp_ms())
+        n = update_knowledge(mock_entity, title="Updated", ut=_FIXED_UT)
         self.assertEqual(n, 1)
-        mock_update_point.assert_called_once()
+        mock_update_point.assert_called_once_with(5, content="Updated", ut=_FIXED_UT)
+        mock_upd_content.assert_called_once_with(1, "Updated")
 
     @patch(f"{_COMPAT}.delete_batch")
     @patch(f"{_COMPAT}.delete_by_batch")
@@ -172,26 +192,23 @@ class KnowledgeRepoTest(TestCase):
         self.assertFalse(ok)
 
     def test_get_invalid_entity_id_returns_none(self):
-        self.assertIsNone(get_knowledge_by_id(None))
-        self.assertIsNone(get_knowledge_by_id(-1))
-        self.assertIsNone(get_knowledge_by_id(0))
-        self.assertIsNone(get_knowledge_by_id("1"))
-
-    def test_list_validation_invalid_offset(self):
-        with self.assertRaises(ValueError) as ctx:
-            list_knowledge(offset=-1, limit=10)
-        self.assertIn("offset", str(ctx.exception).lower())
-        with self.assertRaises(ValueError):
-            list_knowledge(offset=None, limit=10)
-
-    def test_list_validation_invalid_limit(self):
-        with self.assertRaises(ValueError) as ctx:
-            list_knowledge(offset=0, limit=0)
-        self.assertIn("limit", str(ctx.exception).lower())
-        with self.assertRaises(ValueError):
-            list_knowledge(offset=0, limit=LIMIT_LIST + 1)
-        with self.assertRaises(ValueError):
-            list_knowledge(offset=0, limit=None)
+        for bad in (None, -1, 0, "1"):
+            with self.subTest(entity_id=bad):
+                self.assertIsNone(get_knowledge_by_id(bad))
+
+    def test_list_validation(self):
+        cases = [
+            (-1, 10, "offset"),
+            (None, 10, "offset"),
+            (0, 0, "limit"),
+            (0, LIMIT_LIST + 1, "limit"),
+            (0, None, "limit"),
+        ]
+        for offset, limit, field in cases:
+            with self.subTest(offset=offset, limit=limit):
+                with self.assertRaises(ValueError) as ctx:
+                    list_knowledge(offset=offset, limit=limit)
+                self.assertIn(field, str(ctx.exception).lower())
 
     def test_create_empty_title_raises(self):
         with self.assertRaises(ValueError) as ctx:
@@ -220,6 +237,6 @@ class KnowledgeRepoTest(TestCase):
         self.assertIn("entity", str(ctx.exception).lower())
 
     def test_delete_invalid_entity_id_returns_false(self):
-        self.assertFalse(delete_knowledge(None))
-        self.assertFalse(delete_knowledge(-1))
-        self.assertFalse(delete_knowledge(0))
+        for bad in (None, -1, 0, "1"):
+            with self.subTest(entity_id=bad):
+                self.assertFalse(delete_knowledge(bad))
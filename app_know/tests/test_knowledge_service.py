@@ -2,7 +2,8 @@
 Tests for knowledge service (validation and CRUD).
 Generated.
 """
-from django.test import TestCase
+import re
+from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
 from app_know.services.knowledge_service import (
@@ -12,15 +13,30 @@ from app_know.services.knowledge_service import (
 )
 from common.consts.query_const import LIMIT_LIST
 
+_REQUIRED_RE = re.compile(r"required", re.I)
+_NOT_FOUND_RE = re.compile(r"not found", re.I)
+_ENTITY_ID_RE = re.compile(r"entity_id", re.I)
+_LIMIT_RE = re.compile(r"limit", re.I)
+_TITLE_RE = re.compile(r"title", re.I)
+_SOURCE_TYPE_RE = re.compile(r"source_type", re.I)
+
+_LONG_TITLE = "x" * (TITLE_MAX_LEN + 1)
+_LONG_SOURCE_TYPE = "x" * (SOURCE_TYPE_MAX_LEN + 1)
+
 
 class KnowledgeServiceTest(TestCase):
     """Tests for KnowledgeService (fully mocked, no DB required)."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.svc = KnowledgeService()
+        # Stand-in for the entity get_knowledge_by_id finds before update validation runs
+        cls.existing_entity = MagicMock(id=1)
+
     def test_create_requires_title(self):
-        svc = KnowledgeService()
-        with self.assertRaises(ValueError) as ctx:
-            svc.create_knowledge(title="")
-        self.assertIn("required", str(ctx.exception).lower())
+        with self.assertRaisesRegex(ValueError, _REQUIRED_RE):
+            self.svc.create_knowledge(title="")
 
     @patch("app_know.services.knowledge_service.create_knowledge")
     def test_create_success(self, mock_create):
@@ -34,8 +50,7 @@ class KnowledgeServiceTest(TestCase):
         mock_entity.ut = 1700000000000
         mock_create.return_value = mock_entity
 
-        svc = KnowledgeService()
-        out = svc.create_knowledge(
+        out = self.svc.create_knowledge(
             title="My Title",
             description="My desc",
             source_type="document",
@@ -51,89 +66,57 @@ class KnowledgeServiceTest(TestCase):
     @patch("app_know.services.knowledge_service.get_knowledge_by_id")
     def test_get_not_found(self, mock_get):
         mock_get.return_value = None
-        svc = KnowledgeService()
-        with self.assertRaises(ValueError) as ctx:
-            svc.get_knowledge(99999)
-        self.assertIn("not found", str(ctx.exception).lower())
+        with self.assertRaisesRegex(ValueError, _NOT_FOUND_RE):
+            self.svc.get_knowledge(99999)
 
     def test_list_validation(self):
-        svc = KnowledgeService()
         with self.assertRaises(ValueError):
-            svc.list_knowledge(offset=-1)
+            self.svc.list_knowledge(offset=-1)
         with self.assertRaises(ValueError):
-            svc.list_knowledge(limit=0)
+            self.svc.list_knowledge(limit=0)
 
     @patch("app_know.services.knowledge_service.get_knowledge_by_id")
     def test_update_not_found(self, mock_get):
         mock_get.return_value = None
-        svc = KnowledgeService()
-        with self.assertRaises(ValueError) as ctx:
-            svc.update_knowledge(99999, title="X")
-        self.assertIn("not found", str(ctx.exception).lower())
+        with self.assertRaisesRegex(ValueError, _NOT_FOUND_RE):
+            self.svc.update_knowledge(99999, title="X")
 
     @patch("app_know.services.knowledge_service.delete_knowledge")
     def test_delete_not_found(self, mock_delete):
         mock_delete.return_value = False
-        svc = KnowledgeService()
-        with self.assertRaises(ValueError) as ctx:
-            svc.delete_knowledge(99999)
-        self.assertIn("not found", str(ctx.exception).lower())
+        with self.assertRaisesRegex(ValueError, _NOT_FOUND_RE):
+            self.svc.delete_knowledge(99999)
 
     def test_get_invalid_entity_id_raises(self):
-        svc = KnowledgeService()
         for invalid in (None, -1, 0):
-            with self.assertRaises(ValueError) as ctx:
-                svc.get_knowledge(invalid)
-            self.assertIn("entity_id", str(ctx.exception).lower())
+            with self.subTest(entity_id=invalid):
+                with self.assertRaisesRegex(ValueError, _ENTITY_ID_RE):
+                    self.svc.get_knowledge(invalid)
 
     def test_update_invalid_entity_id_raises(self):
-        svc = KnowledgeService()
-        with self.assertRaises(ValueError) as ctx:
-            svc.update_knowledge(0, title="x")
-        self.assertIn("entity_id", str(ctx.exception).lower())
+        with self.assertRaisesRegex(ValueError, _ENTITY_ID_RE):
+            self.svc.update_knowledge(0, title="x")
 
     def test_delete_invalid_entity_id_raises(self):
-        svc = KnowledgeService()
-        with self.assertRaises(ValueError) as ctx:
-            svc.delete_knowledge(-1)
-        self.assertIn("entity_id", str(ctx.exception).lower())
+        with self.assertRaisesRegex(ValueError, _ENTITY_ID_RE):
+            self.svc.delete_knowledge(-1)
 
     def test_list_limit_over_max_raises(self):
-        svc = KnowledgeService()
-        with self.assertRaises(ValueError) as ctx:
-            svc.list_knowledge(offset=0, limit=LIMIT_LIST + 1)
-        self.assertIn("limit", str(ctx.exception).lower())
-
-    def test_create_title_too_long_raises(self):
-        svc = KnowledgeService()
-        with self.assertRaises(ValueError) as ctx:
-            svc.create_knowledge(title="x" * (TITLE_MAX_LEN + 1))
-        self.assertIn("title", str(ctx.exception).lower())
-
-    def test_create_source_type_too_long_raises(self):
-        svc = KnowledgeService()
-        with self.assertRaises(ValueError) as ctx:
-            svc.create_knowledge(title="Ok", source_type="x" * (SOURCE_TYPE_MAX_LEN + 1))
-        self.assertIn("source_type", str(ctx.exception).lower())
+        with self.assertRaisesRegex(ValueError, _LIMIT_RE):
+            self.svc.list_knowledge(offset=0, limit=LIMIT_LIST + 1)
 
     @patch("app_know.services.knowledge_service.get_knowledge_by_id")
-    def test_update_title_too_long_raises(self, mock_get):
-        mock_entity = MagicMock()
-        mock_entity.id = 1
-        mock_get.return_value = mock_entity
-
-        svc = KnowledgeService()
-        with self.assertRaises(ValueError) as ctx:
-            svc.update_knowledge(1, title="x" * (TITLE_MAX_LEN + 1))
-        self.assertIn("title", str(ctx.exception).lower())
-
-    @patch("app_know.services.knowledge_service.get_knowledge_by_id")
-    def test_update_source_type_too_long_raises(self, mock_get):
-        mock_entity = MagicMock()
-        mock_entity.id = 1
-        mock_get.return_value = mock_entity
-
-        svc = KnowledgeService()
-        with self.assertRaises(ValueError) as ctx:
-            svc.update_knowledge(1, source_type="x" * (SOURCE_TYPE_MAX_LEN + 1))
-        self.assertIn("source_type", str(ctx.exception).lower())
+    def test_field_too_long_raises(self, mock_get):
+        mock_get.return_value = self.existing_entity
+
+        cases = [
+            ("title", _LONG_TITLE, _TITLE_RE),
+            ("source_type", _LONG_SOURCE_TYPE, _SOURCE_TYPE_RE),
+        ]
+        for field, value, pattern in cases:
+            with self.subTest(op="create", field=field):
+                with self.assertRaisesRegex(ValueError, pattern):
+                    self.svc.create_knowledge(**{"title": "Ok", field: value})
+            with self.subTest(op="update", field=field):
+                with self.assertRaisesRegex(ValueError, pattern):
+                    self.svc.update_knowledge(1, **{field: value})
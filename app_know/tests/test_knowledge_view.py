@@ -1,335 +1,192 @@
 """
-Tests for Knowledge REST API views (CRUD endpoints).
+Tests for Knowledge REST API views (batch list and detail endpoints).
 Generated.
 """
 import json
-from django.test import TestCase
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from app_know.views.knowledge_view import KnowledgeListView, KnowledgeDetailView
-from common.consts.query_const import LIMIT_LIST
 from common.consts.response_const import (
     RET_OK,
     RET_RESOURCE_NOT_FOUND,
-    RET_MISSING_PARAM,
     RET_INVALID_PARAM,
 )
 
+_VIEW = "app_know.views.knowledge_view"
+_LIST_URL = "/api/know/knowledge"
+_JSON = "application/json"
+
+# Static request payloads, JSON-encoded once at import
+_CREATE_BODY = json.dumps({"title": "API Title", "description": "Desc", "source_type": "doc"}).encode()
+_PUT_TITLE_BODY = json.dumps({"title": "Updated Title"}).encode()
+_PUT_UPDATED_BODY = json.dumps({"title": "Updated"}).encode()
+
 
-class KnowledgeListViewTest(TestCase):
-    """Tests for KnowledgeListView (fully mocked, no DB required)."""
+def _point(seq, content, ct=1700000000000, ut=1700000000000):
+    """Stand-in for a KnowledgePoint row with the fields the batch views read."""
+    return SimpleNamespace(seq=seq, content=content, ct=ct, ut=ut)
 
-    def setUp(self):
-        self.factory = APIRequestFactory()
 
-    @patch("app_know.views.knowledge_view.KnowledgeService")
-    def test_list_empty(self, mock_svc_cls):
-        mock_svc = MagicMock()
-        mock_svc.list_knowledge.return_value = {"total_num": 0, "data": []}
-        mock_svc_cls.return_value = mock_svc
+class KnowledgeListViewTest(SimpleTestCase):
+    """Tests for KnowledgeListView; batch repo functions are patched, no DB required."""
 
-        request = self.factory.get("/api/know/knowledge")
-        response = KnowledgeListView.as_view()(request)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.factory = APIRequestFactory()
+        # as_view() returns a plain function; staticmethod keeps self from being bound to it
+        cls.list_view = staticmethod(KnowledgeListView.as_view())
+
+    @patch(f"{_VIEW}.list_by_batch")
+    @patch(f"{_VIEW}.list_distinct_batch_ids")
+    def test_list_empty(self, mock_batch_ids, mock_list_by_batch):
+        mock_batch_ids.return_value = []
+
+        request = self.factory.get(_LIST_URL)
+        response = self.list_view(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["data"]["total_num"], 0)
         self.assertEqual(data["data"]["data"], [])
+        mock_list_by_batch.assert_not_called()
 
-    @patch("app_know.views.knowledge_view.KnowledgeService")
-    def test_create_success(self, mock_svc_cls):
-        mock_svc = MagicMock()
-        mock_svc.create_knowledge.return_value = {
-            "id": 1,
-            "title": "API Title",
-            "description": "Desc",
-            "content": "",
-            "source_type": "doc",
-            "ct": 1700000000000,
-            "ut": 1700000000000,
-        }
-        mock_svc_cls.return_value = mock_svc
+    @patch(f"{_VIEW}.list_by_batch")
+    @patch(f"{_VIEW}.list_distinct_batch_ids")
+    def test_list_titles_batches_from_first_point(self, mock_batch_ids, mock_list_by_batch):
+        mock_batch_ids.return_value = [1, 2]
+        mock_list_by_batch.side_effect = [([_point(0, "A" * 100)], 3), ([], 0)]
 
-        request = self.factory.post(
-            "/api/know/knowledge",
-            data={"title": "API Title", "description": "Desc", "source_type": "doc"},
-            format="json",
-        )
-        response = KnowledgeListView.as_view()(request)
+        request = self.factory.get(_LIST_URL, {"limit": 10})
+        response = self.list_view(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
-        self.assertIn("id", data["data"])
-        self.assertEqual(data["data"]["title"], "API Title")
-
-    def test_create_missing_title(self):
-        request = self.factory.post(
-            "/api/know/knowledge",
-            data={"description": "Only desc"},
-            format="json",
-        )
-        response = KnowledgeListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
-
-    @patch("app_know.views.knowledge_view.KnowledgeService")
-    def test_list_with_params(self, mock_svc_cls):
-        mock_svc = MagicMock()
-        mock_svc.list_knowledge.return_value = {
-            "total_num": 1,
-            "data": [{"id": 1, "title": "A", "source_type": "doc"}],
-        }
-        mock_svc_cls.return_value = mock_svc
-
-        request = self.factory.get(
-            "/api/know/knowledge",
-            {"offset": 0, "limit": 10, "source_type": "doc"},
-        )
-        response = KnowledgeListView.as_view()(request)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        self.assertEqual(data["data"]["total_num"], 2)
+        self.assertEqual(data["data"]["data"], [
+            {"id": 1, "title": "A" * 80 + "..."},
+            {"id": 2, "title": "Batch 2"},
+        ])
+        mock_batch_ids.assert_called_once_with(limit=10)
+
+    @patch(f"{_VIEW}.list_by_batch")
+    @patch(f"{_VIEW}.list_distinct_batch_ids")
+    def test_list_out_of_range_limit_uses_default(self, mock_batch_ids, mock_list_by_batch):
+        mock_batch_ids.return_value = []
+        for limit in (0, -1, 501):
+            with self.subTest(limit=limit):
+                mock_batch_ids.reset_mock()
+                response = self.list_view(self.factory.get(_LIST_URL, {"limit": limit}))
+                self.assertEqual(response.data["errorCode"], RET_OK)
+                mock_batch_ids.assert_called_once_with(limit=100)
+
+    @patch(f"{_VIEW}.list_distinct_batch_ids")
+    @patch(f"{_VIEW}.list_by_batch")
+    def test_list_filters_by_batch_id(self, mock_list_by_batch, mock_batch_ids):
+        mock_list_by_batch.return_value = ([_point(0, "Only point")], 1)
+
+        request = self.factory.get(_LIST_URL, {"batch_id": 3})
+        response = self.list_view(request)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
-        self.assertEqual(data["data"]["total_num"], 1)
-        self.assertEqual(len(data["data"]["data"]), 1)
-        self.assertEqual(data["data"]["data"][0]["source_type"], "doc")
-
-    def test_list_validation_invalid_offset(self):
-        request = self.factory.get("/api/know/knowledge", {"offset": -1})
-        response = KnowledgeListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        self.assertEqual(data["data"]["data"], [{"id": 3, "title": "Only point"}])
+        mock_list_by_batch.assert_called_once_with(3, limit=1)
+        mock_batch_ids.assert_not_called()
+
+    def test_create_points_to_upload_endpoint(self):
+        """Batches are created through the upload endpoint; POST here is rejected without touching repos."""
+        request = self.factory.post(_LIST_URL, _CREATE_BODY, content_type=_JSON)
+        response = self.list_view(request)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
+        self.assertIn("upload", data["message"])
 
-    def test_list_validation_invalid_limit(self):
-        request = self.factory.get("/api/know/knowledge", {"limit": 0})
-        response = KnowledgeListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
-    def test_list_limit_over_max_returns_validation_error(self):
-        request = self.factory.get(
-            "/api/know/knowledge",
-            {"offset": 0, "limit": LIMIT_LIST + 1},
-        )
-        response = KnowledgeListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
-
-    def test_list_offset_non_numeric_returns_validation_error(self):
-        request = self.factory.get("/api/know/knowledge", {"offset": "x"})
-        response = KnowledgeListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
-
-    def test_create_empty_title_whitespace_returns_validation_error(self):
-        request = self.factory.post(
-            "/api/know/knowledge",
-            data={"title": "   ", "source_type": "doc"},
-            format="json",
-        )
-        response = KnowledgeListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
-
-    @patch("app_know.views.knowledge_view.KnowledgeService")
-    def test_create_with_description_as_number_coerced_to_string(self, mock_svc_cls):
-        """Create knowledge with description as number is coerced to string (edge case)."""
-        mock_svc = MagicMock()
-        mock_svc.create_knowledge.return_value = {
-            "id": 1,
-            "title": "Num Desc",
-            "description": "12345",
-            "content": "",
-            "source_type": "doc",
-            "ct": 1700000000000,
-            "ut": 1700000000000,
-        }
-        mock_svc_cls.return_value = mock_svc
-
-        request = self.factory.post(
-            "/api/know/knowledge",
-            data={"title": "Num Desc", "description": 12345, "source_type": "doc"},
-            format="json",
-        )
-        response = KnowledgeListView.as_view()(request)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_OK)
-        self.assertIn("id", data["data"])
-        self.assertEqual(data["data"]["description"], "12345")
+class KnowledgeDetailViewTest(SimpleTestCase):
+    """Tests for KnowledgeDetailView; batch repo functions are patched, no DB required."""
 
+    entity_id = 1
 
-class KnowledgeDetailViewTest(TestCase):
-    """Tests for KnowledgeDetailView (fully mocked, no DB required)."""
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.factory = APIRequestFactory()
+        cls.detail_view = staticmethod(KnowledgeDetailView.as_view())
 
-    def setUp(self):
-        self.factory = APIRequestFactory()
-        self.entity_id = 1
+    @patch(f"{_VIEW}.list_by_batch")
+    def test_get_success(self, mock_list_by_batch):
+        mock_list_by_batch.return_value = (
+            [_point(0, "First point"), _point(1, "Second", ut=1700000000002)], 2)
 
-    @patch("app_know.views.knowledge_view.KnowledgeService")
-    def test_get_success(self, mock_svc_cls):
-        mock_svc = MagicMock()
-        mock_svc.get_knowledge.return_value = {
-            "id": self.entity_id,
-            "title": "Detail Test",
-            "description": "D",
-            "content": "Some content",
-            "source_type": "doc",
-            "ct": 1700000000000,
-            "ut": 1700000000000,
-        }
-        mock_svc_cls.return_value = mock_svc
-
-        request = self.factory.get(f"/api/know/knowledge/{self.entity_id}")
-        response = KnowledgeDetailView.as_view()(request, entity_id=self.entity_id)
+        request = self.factory.get(f"{_LIST_URL}/{self.entity_id}")
+        response = self.detail_view(request, entity_id=self.entity_id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["data"]["id"], self.entity_id)
-        self.assertEqual(data["data"]["title"], "Detail Test")
-
-    @patch("app_know.views.knowledge_view.KnowledgeService")
-    def test_get_not_found(self, mock_svc_cls):
-        mock_svc = MagicMock()
-        mock_svc.get_knowledge.side_effect = ValueError("Knowledge 99999 not found")
-        mock_svc_cls.return_value = mock_svc
-
-        request = self.factory.get("/api/know/knowledge/99999")
-        response = KnowledgeDetailView.as_view()(request, entity_id=99999)
-        response.render()
-        data = json.loads(response.content)
+        self.assertEqual(data["data"]["title"], "First point")
+        self.assertEqual(data["data"]["content"], "First point\nSecond")
+        self.assertEqual(data["data"]["source_type"], "batch")
+        self.assertEqual(data["data"]["ut"], 1700000000002)
+        mock_list_by_batch.assert_called_once_with(self.entity_id, limit=1000)
+
+    @patch(f"{_VIEW}.list_by_batch")
+    def test_get_not_found(self, mock_list_by_batch):
+        mock_list_by_batch.return_value = ([], 0)
+
+        request = self.factory.get(f"{_LIST_URL}/99999")
+        response = self.detail_view(request, entity_id=99999)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_RESOURCE_NOT_FOUND)
 
-    @patch("app_know.views.knowledge_view.KnowledgeService")
-    def test_put_success(self, mock_svc_cls):
-        mock_svc = MagicMock()
-        mock_svc.update_knowledge.return_value = {
-            "id": self.entity_id,
-            "title": "Updated Title",
-            "description": "D",
-            "content": "",
-            "source_type": "doc",
-            "ct": 1700000000000,
-            "ut": 1700000000001,
-        }
-        mock_svc_cls.return_value = mock_svc
-
-        request = self.factory.put(
-            f"/api/know/knowledge/{self.entity_id}",
-            data={"title": "Updated Title"},
-            format="json",
-        )
-        response = KnowledgeDetailView.as_view()(request, entity_id=self.entity_id)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_OK)
-        self.assertEqual(data["data"]["title"], "Updated Title")
+    def test_put_is_not_supported(self):
+        """Batches are replaced through the parse endpoint; PUT is rejected."""
+        request = self.factory.put(f"{_LIST_URL}/{self.entity_id}", _PUT_TITLE_BODY, content_type=_JSON)
+        response = self.detail_view(request, entity_id=self.entity_id)
+        data = response.data
+        self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
-    @patch("app_know.views.knowledge_view.KnowledgeService")
-    def test_delete_success(self, mock_svc_cls):
-        """Delete knowledge entity; service fully mocked."""
-        mock_svc = MagicMock()
-        mock_svc.delete_knowledge.return_value = True
-        mock_svc_cls.return_value = mock_svc
+    @patch(f"{_VIEW}.delete_batch")
+    @patch(f"{_VIEW}.delete_by_batch")
+    def test_delete_success(self, mock_delete_by_batch, mock_delete_batch):
+        mock_delete_by_batch.return_value = 2
+        mock_delete_batch.return_value = True
 
-        request = self.factory.delete(f"/api/know/knowledge/{self.entity_id}")
-        response = KnowledgeDetailView.as_view()(request, entity_id=self.entity_id)
+        request = self.factory.delete(f"{_LIST_URL}/{self.entity_id}")
+        response = self.detail_view(request, entity_id=self.entity_id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
-        mock_svc.delete_knowledge.assert_called_once_with(self.entity_id)
-
-    @patch("app_know.views.knowledge_view.KnowledgeService")
-    def test_delete_not_found(self, mock_svc_cls):
-        mock_svc = MagicMock()
-        mock_svc.delete_knowledge.side_effect = ValueError("Knowledge 99999 not found")
-        mock_svc_cls.return_value = mock_svc
-
-        request = self.factory.delete("/api/know/knowledge/99999")
-        response = KnowledgeDetailView.as_view()(request, entity_id=99999)
-        response.render()
-        data = json.loads(response.content)
+        self.assertEqual(data["data"], {"deleted": 2})
+        mock_delete_by_batch.assert_called_once_with(self.entity_id)
+        mock_delete_batch.assert_called_once_with(self.entity_id)
+
+    @patch(f"{_VIEW}.delete_batch")
+    @patch(f"{_VIEW}.delete_by_batch")
+    def test_delete_not_found(self, mock_delete_by_batch, mock_delete_batch):
+        mock_delete_by_batch.return_value = 0
+        mock_delete_batch.return_value = False
+
+        request = self.factory.delete(f"{_LIST_URL}/99999")
+        response = self.detail_view(request, entity_id=99999)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_RESOURCE_NOT_FOUND)
 
-    @patch("app_know.views.knowledge_view.KnowledgeService")
-    def test_put_empty_title_validation(self, mock_svc_cls):
-        mock_svc = MagicMock()
-        mock_svc.update_knowledge.side_effect = ValueError("title cannot be empty")
-        mock_svc_cls.return_value = mock_svc
-
-        request = self.factory.put(
-            f"/api/know/knowledge/{self.entity_id}",
-            data={"title": "   "},
-            format="json",
-        )
-        response = KnowledgeDetailView.as_view()(request, entity_id=self.entity_id)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
-
-    def test_get_entity_id_zero_returns_invalid_param(self):
-        request = self.factory.get("/api/know/knowledge/0")
-        response = KnowledgeDetailView.as_view()(request, entity_id=0)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
-
-    def test_put_entity_id_zero_returns_invalid_param(self):
-        request = self.factory.put(
-            "/api/know/knowledge/0",
-            data={"title": "Updated"},
-            format="json",
-        )
-        response = KnowledgeDetailView.as_view()(request, entity_id=0)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
-
-    def test_delete_entity_id_zero_returns_invalid_param(self):
-        request = self.factory.delete("/api/know/knowledge/0")
-        response = KnowledgeDetailView.as_view()(request, entity_id=0)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
-
-    def test_get_entity_id_negative_returns_invalid_param(self):
-        """Detail view rejects negative entity_id (input validation)."""
-        request = self.factory.get("/api/know/knowledge/-1")
-        response = KnowledgeDetailView.as_view()(request, entity_id=-1)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
-
-    def test_put_entity_id_negative_returns_invalid_param(self):
-        """PUT with negative entity_id returns invalid param."""
-        request = self.factory.put(
-            "/api/know/knowledge/-1",
-            data={"title": "Updated"},
-            format="json",
-        )
-        response = KnowledgeDetailView.as_view()(request, entity_id=-1)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
-
-    def test_delete_entity_id_negative_returns_invalid_param(self):
-        """DELETE with negative entity_id returns invalid param (input validation)."""
-        request = self.factory.delete("/api/know/knowledge/-1")
-        response = KnowledgeDetailView.as_view()(request, entity_id=-1)
-        response.render()
-        data = json.loads(response.content)
-        self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
+    def test_invalid_entity_id_returns_invalid_param(self):
+        """Detail view rejects zero and negative entity_id on every method (input validation)."""
+        for method in ("get", "put", "delete"):
+            for entity_id in (0, -1):
+                with self.subTest(method=method, entity_id=entity_id):
+                    url = f"{_LIST_URL}/{entity_id}"
+                    if method == "put":
+                        request = self.factory.put(url, _PUT_UPDATED_BODY, content_type=_JSON)
+                    else:
+                        request = getattr(self.factory, method)(url)
+                    response = self.detail_view(request, entity_id=entity_id)
+                    data = response.data
+                    self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
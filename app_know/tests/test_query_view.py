@@ -32,8 +32,7 @@ class LogicalQueryViewTest(TestCase):
         request = self.factory.get("/api/know/knowledge/query", {"query": "test", "app_id": "myapp"})
         response = LogicalQueryView.as_view()(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(len(data["data"]["data"]), 1)
         mock_svc.query.assert_called_once()
@@ -56,16 +55,14 @@ class LogicalQueryViewTest(TestCase):
     def test_get_missing_query(self):
         request = self.factory.get("/api/know/knowledge/query")
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertNotEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     def test_get_invalid_limit(self):
         request = self.factory.get("/api/know/knowledge/query", {"query": "x", "limit": "big"})
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_get_limit_boundary_one(self):
@@ -96,8 +93,7 @@ class LogicalQueryViewTest(TestCase):
     def test_get_limit_zero_returns_invalid_param(self):
         request = self.factory.get("/api/know/knowledge/query", {"query": "x", "limit": "0"})
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_get_limit_over_max_returns_invalid_param(self):
@@ -105,8 +101,7 @@ class LogicalQueryViewTest(TestCase):
             "/api/know/knowledge/query", {"query": "x", "limit": str(LIMIT_LIST + 1)}
         )
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_get_query_too_long_returns_invalid_param(self):
@@ -115,8 +110,7 @@ class LogicalQueryViewTest(TestCase):
             {"query": "x" * (QUERY_SEARCH_MAX_LEN + 1)},
         )
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
         self.assertIn("exceed", data.get("message", "").lower())
 
@@ -128,8 +122,7 @@ class LogicalQueryViewTest(TestCase):
             content_type="application/json",
         )
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     def test_post_invalid_json_returns_parse_error(self):
@@ -139,8 +132,7 @@ class LogicalQueryViewTest(TestCase):
             content_type="application/json",
         )
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_JSON_PARSE_ERROR)
 
     def test_post_query_too_long_returns_invalid_param(self):
@@ -150,8 +142,7 @@ class LogicalQueryViewTest(TestCase):
             content_type="application/json",
         )
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     @patch("app_know.views.query_view.LogicalQueryService")
@@ -159,8 +150,7 @@ class LogicalQueryViewTest(TestCase):
         mock_svc_cls.return_value.query.side_effect = RuntimeError("Atlas connection failed")
         request = self.factory.get("/api/know/knowledge/query", {"query": "test"})
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_DB_ERROR)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
@@ -173,8 +163,7 @@ class LogicalQueryViewTest(TestCase):
             content_type="application/json",
         )
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_DB_ERROR)
 
     @patch("app_know.views.query_view.LogicalQueryService")
@@ -236,8 +225,7 @@ class LogicalQueryViewTest(TestCase):
             content_type="application/json",
         )
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     @patch("app_know.views.query_view.LogicalQueryService")
@@ -294,8 +282,7 @@ class LogicalQueryViewTest(TestCase):
         )
         response = LogicalQueryView.as_view()(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         call_kw = mock_svc.query.call_args[1]
         self.assertEqual(call_kw["output_format"], "triple")
@@ -307,8 +294,7 @@ class LogicalQueryViewTest(TestCase):
             {"query": "test", "max_hops": "abc"},
         )
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_get_max_hops_over_limit_returns_invalid_param(self):
@@ -319,8 +305,7 @@ class LogicalQueryViewTest(TestCase):
             {"query": "test", "max_hops": str(MAX_HOPS_LIMIT + 1)},
         )
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_get_max_hops_zero_returns_invalid_param(self):
@@ -330,8 +315,7 @@ class LogicalQueryViewTest(TestCase):
             {"query": "test", "max_hops": "0"},
         )
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     @patch("app_know.views.query_view.LogicalQueryService")
@@ -365,8 +349,7 @@ class LogicalQueryViewTest(TestCase):
             content_type="application/json",
         )
         response = LogicalQueryView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
         self.assertIn("limit", data.get("message", "").lower())
 
@@ -383,8 +366,7 @@ class LogicalQueryViewTest(TestCase):
         )
         response = LogicalQueryView.as_view()(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         call_kw = mock_svc.query.call_args[1]
         self.assertEqual(call_kw["query"], "from body")
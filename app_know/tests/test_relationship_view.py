@@ -2,7 +2,6 @@
 Tests for relationship REST API views (create/update/query, validation, and error handling).
 RelationshipService is mocked so no real Neo4j connection is used. Generated.
 """
-import json
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
@@ -31,8 +30,7 @@ class RelationshipListViewTest(TestCase):
     def test_query_missing_app_id_returns_validation_error(self):
         request = self.factory.get("/api/know/knowledge/relationships")
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
@@ -51,8 +49,7 @@ class RelationshipListViewTest(TestCase):
         )
         response = RelationshipListView.as_view()(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["data"]["total_num"], 0)
         self.assertEqual(data["data"]["data"], [])
@@ -69,8 +66,7 @@ class RelationshipListViewTest(TestCase):
             format="json",
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     def test_create_invalid_relationship_type_returns_invalid_param(self):
@@ -86,8 +82,7 @@ class RelationshipListViewTest(TestCase):
             format="json",
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_create_knowledge_entity_missing_entity_type_returns_validation_error(self):
@@ -102,8 +97,7 @@ class RelationshipListViewTest(TestCase):
             format="json",
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     def test_create_knowledge_knowledge_missing_target_returns_validation_error(self):
@@ -117,8 +111,7 @@ class RelationshipListViewTest(TestCase):
             format="json",
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     @patch("app_know.views.relationship_view.RelationshipService")
@@ -147,8 +140,7 @@ class RelationshipListViewTest(TestCase):
         )
         response = RelationshipListView.as_view()(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["data"]["relationship_type"], "knowledge_entity")
         self.assertEqual(data["data"]["entity_id"], "e1")
@@ -159,8 +151,7 @@ class RelationshipListViewTest(TestCase):
             {"app_id": "myapp", "limit": "x", "offset": 0},
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
@@ -171,8 +162,7 @@ class RelationshipListViewTest(TestCase):
             {"app_id": "myapp", "limit": "10", "offset": "y"},
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
@@ -183,8 +173,7 @@ class RelationshipListViewTest(TestCase):
             {"app_id": "myapp", "limit": "0", "offset": "0"},
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
@@ -195,8 +184,7 @@ class RelationshipListViewTest(TestCase):
             {"app_id": "myapp", "limit": "10", "offset": "-1"},
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
@@ -207,8 +195,7 @@ class RelationshipListViewTest(TestCase):
             content_type="application/json",
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     @patch("app_know.views.relationship_view.RelationshipService")
@@ -228,8 +215,7 @@ class RelationshipListViewTest(TestCase):
             format="json",
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["errorCode"], RET_DB_ERROR)
 
@@ -262,8 +248,7 @@ class RelationshipListViewTest(TestCase):
         )
         response = RelationshipListView.as_view()(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["data"]["predicate"], "belongs_to")
 
@@ -321,8 +306,7 @@ class RelationshipListViewTest(TestCase):
         )
         response = TestRelationshipListView.as_view()(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         mock_service.query_relationships_as_triples.assert_called_once()
         self.assertIn("subject", data["data"]["data"][0])
@@ -339,8 +323,7 @@ class RelationshipDetailViewTest(TestCase):
         response = RelationshipDetailView.as_view()(
             request, relationship_id=1
         )
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     @patch("app_know.views.relationship_view.RelationshipService")
@@ -355,8 +338,7 @@ class RelationshipDetailViewTest(TestCase):
         response = RelationshipDetailView.as_view()(
             request, relationship_id=999
         )
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_RESOURCE_NOT_FOUND)
 
     @patch("app_know.views.relationship_view.RelationshipService")
@@ -376,8 +358,7 @@ class RelationshipDetailViewTest(TestCase):
             request, relationship_id=1
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["data"]["relationship_id"], 1)
 
@@ -389,8 +370,7 @@ class RelationshipDetailViewTest(TestCase):
             format="json",
         )
         response = RelationshipDetailView.as_view()(request, relationship_id=1)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     def test_put_missing_properties_returns_validation_error(self):
@@ -402,8 +382,7 @@ class RelationshipDetailViewTest(TestCase):
         response = RelationshipDetailView.as_view()(
             request, relationship_id=1
         )
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     @patch("app_know.views.relationship_view.RelationshipService")
@@ -424,8 +403,7 @@ class RelationshipDetailViewTest(TestCase):
             request, relationship_id=1
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["data"]["properties"]["updated"], True)
 
@@ -436,16 +414,14 @@ class RelationshipDetailViewTest(TestCase):
             format="json",
         )
         response = RelationshipDetailView.as_view()(request, relationship_id=1)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     def test_delete_missing_app_id_returns_validation_error(self):
         """DELETE with missing app_id returns RET_MISSING_PARAM."""
         request = self.factory.delete("/api/know/knowledge/relationships/1")
         response = RelationshipDetailView.as_view()(request, relationship_id=1)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     @patch("app_know.views.relationship_view.RelationshipService")
@@ -459,8 +435,7 @@ class RelationshipDetailViewTest(TestCase):
         )
         response = RelationshipDetailView.as_view()(request, relationship_id=1)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
 
     @patch("app_know.views.relationship_view.RelationshipService")
@@ -473,8 +448,7 @@ class RelationshipDetailViewTest(TestCase):
             "/api/know/knowledge/relationships/999?app_id=myapp"
         )
         response = RelationshipDetailView.as_view()(request, relationship_id=999)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_RESOURCE_NOT_FOUND)
 
     def test_delete_invalid_relationship_id_returns_invalid_param(self):
@@ -483,8 +457,7 @@ class RelationshipDetailViewTest(TestCase):
             "/api/know/knowledge/relationships/0?app_id=myapp"
         )
         response = RelationshipDetailView.as_view()(request, relationship_id=0)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
 
@@ -529,8 +502,7 @@ class RelationshipEndpointIntegrationTest(TestCase):
             {"app_id": "myapp", "limit": "x", "offset": 0},
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
@@ -541,8 +513,7 @@ class RelationshipEndpointIntegrationTest(TestCase):
             content_type="application/json",
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     @patch("app_know.views.relationship_view.RelationshipService")
@@ -562,8 +533,7 @@ class RelationshipEndpointIntegrationTest(TestCase):
             format="json",
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["errorCode"], RET_DB_ERROR)
 
@@ -574,8 +544,7 @@ class RelationshipEndpointIntegrationTest(TestCase):
             format="json",
         )
         response = RelationshipDetailView.as_view()(request, relationship_id=1)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     @patch("app_know.views.relationship_view.RelationshipService")
@@ -621,8 +590,7 @@ class RelationshipEndpointIntegrationTest(TestCase):
             {"app_id": "myapp"},
         )
         response = RelationshipDetailView.as_view()(request, relationship_id=0)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_get_detail_invalid_relationship_id_non_integer_returns_invalid_param(self):
@@ -632,8 +600,7 @@ class RelationshipEndpointIntegrationTest(TestCase):
             {"app_id": "myapp"},
         )
         response = RelationshipDetailView.as_view()(request, relationship_id="abc")
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_put_detail_invalid_relationship_id_returns_invalid_param(self):
@@ -644,8 +611,7 @@ class RelationshipEndpointIntegrationTest(TestCase):
             format="json",
         )
         response = RelationshipDetailView.as_view()(request, relationship_id=0)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_get_list_negative_offset_returns_validation_error(self):
@@ -654,8 +620,7 @@ class RelationshipEndpointIntegrationTest(TestCase):
             {"app_id": "myapp", "offset": "-1", "limit": "10"},
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_get_list_limit_over_max_returns_validation_error(self):
@@ -664,8 +629,7 @@ class RelationshipEndpointIntegrationTest(TestCase):
             {"app_id": "myapp", "limit": str(LIMIT_LIST + 1), "offset": "0"},
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_post_invalid_json_body_returns_parse_error(self):
@@ -676,6 +640,5 @@ class RelationshipEndpointIntegrationTest(TestCase):
             content_type="application/json",
         )
         response = RelationshipListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_JSON_PARSE_ERROR)
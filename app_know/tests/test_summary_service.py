@@ -1,11 +1,14 @@
 """
 Tests for summary service (generate, get, list, delete); validation and edge cases. Generated.
 """
+import threading
+from concurrent.futures import Future
+
 from django.test import TestCase
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
-from app_know.services.summary_generator import generate_summary
-from app_know.services.summary_service import SummaryService
+from app_know.services.summary_generator import SUMMARY_SOURCE_AI, SUMMARY_SOURCE_RULE, generate_summary
+from app_know.services.summary_service import DELETE_BATCH_SIZE, SummaryService, _content_hash
 from common.consts.query_const import LIMIT_LIST
 
 
@@ -44,6 +47,13 @@ class SummaryGeneratorTest(TestCase):
         self.assertLessEqual(len(out), 103)
         self.assertTrue(out.endswith("...") or len(out) <= 100)
 
+    def test_generate_truncates_large_content(self):
+        """Large content yields the same truncated summary as formatting it in full."""
+        content = "y" * 100_000
+        out = generate_summary(title="T", content=content, source_type="doc", max_length=100)
+        expected = f"Title: T Content: {content} (Source: doc)"[:97].rstrip() + "..."
+        self.assertEqual(out, expected)
+
     @patch("app_aibroker.outbound_client.aibroker_ask_and_answer")
     def test_generate_with_ai_success(self, mock_ai):
         """generate_summary with use_ai=True uses app_aibroker when available."""
@@ -96,13 +106,9 @@ class SummaryServiceTest(TestCase):
     @patch("app_know.services.summary_service.repo_list_summaries")
     @patch("app_know.services.summary_service.repo_get_summary")
     @patch("app_know.services.summary_service.save_summary")
-    @patch("app_know.services.summary_service.get_knowledge_by_id")
-    def test_generate_and_save_success(self, mock_get_know, mock_save, mock_get_summary, mock_list):
-        mock_entity = MagicMock()
-        mock_entity.title = "Title"
-        mock_entity.description = "Desc"
-        mock_entity.source_type = "doc"
-        mock_get_know.return_value = mock_entity
+    @patch("app_know.services.summary_service.get_knowledge_fields")
+    def test_generate_and_save_success(self, mock_get_fields, mock_save, mock_get_summary, mock_list):
+        mock_get_fields.return_value = ("Title", "Desc", "", "doc")
         mock_save.return_value = {"kid": 1, "summary": "Title: Title Description: Desc", "app_id": 1}
 
         svc = SummaryService()
@@ -125,21 +131,18 @@ class SummaryServiceTest(TestCase):
         with self.assertRaises(ValueError):
             svc.generate_and_save(knowledge_id=0, app_id=1)
 
-    @patch("app_know.services.summary_service.get_knowledge_by_id")
-    def test_generate_and_save_knowledge_not_found(self, mock_get_know):
-        mock_get_know.return_value = None
+    @patch("app_know.services.summary_service.get_knowledge_fields")
+    def test_generate_and_save_knowledge_not_found(self, mock_get_fields):
+        mock_get_fields.return_value = None
         svc = SummaryService()
         with self.assertRaises(ValueError) as ctx:
             svc.generate_and_save(knowledge_id=99999, app_id=1)
         self.assertIn("not found", str(ctx.exception))
 
     @patch("app_know.services.summary_service.save_summary")
-    @patch("app_know.services.summary_service.get_knowledge_by_id")
-    def test_generate_and_save_empty_title_raises(self, mock_get_know, mock_save):
-        mock_entity = MagicMock()
-        mock_entity.title = ""
-        mock_entity.description = None
-        mock_get_know.return_value = mock_entity
+    @patch("app_know.services.summary_service.get_knowledge_fields")
+    def test_generate_and_save_empty_title_raises(self, mock_get_fields, mock_save):
+        mock_get_fields.return_value = ("", "", "", "")
         svc = SummaryService()
         with self.assertRaises(ValueError) as ctx:
             svc.generate_and_save(knowledge_id=1, app_id=1)
@@ -158,6 +161,21 @@ class SummaryServiceTest(TestCase):
             svc.get_summary(knowledge_id=-1)
         self.assertIn("positive", str(ctx.exception).lower())
 
+    def test_get_summary_validation_bool_id(self):
+        """get_summary rejects bool knowledge_id even though bool subclasses int."""
+        svc = SummaryService()
+        with self.assertRaises(ValueError) as ctx:
+            svc.get_summary(knowledge_id=True)
+        self.assertIn("integer", str(ctx.exception))
+
+    @patch("app_know.services.summary_service.repo_get_summary")
+    def test_get_summary_coerces_knowledge_id(self, mock_get):
+        """get_summary passes the coerced int knowledge_id to the repo."""
+        mock_get.return_value = None
+        svc = SummaryService()
+        svc.get_summary(knowledge_id="3")
+        mock_get.assert_called_once_with(knowledge_id=3, app_id=None)
+
     @patch("app_know.services.summary_service.repo_list_summaries")
     def test_list_summaries_validation(self, mock_list):
         mock_list.return_value = ([], 0)
@@ -194,13 +212,42 @@ class SummaryServiceTest(TestCase):
         self.assertEqual(len(out["data"]), 1)
         self.assertIsNone(out["next_offset"])
 
-    @patch("app_know.services.summary_service.delete_by_knowledge_id")
+    @patch("app_know.services.summary_service.delete_by_knowledge_ids")
     def test_delete_summaries_for_knowledge(self, mock_del):
         mock_del.return_value = 2
         svc = SummaryService()
         n = svc.delete_summaries_for_knowledge(knowledge_id=1)
         self.assertEqual(n, 2)
-        mock_del.assert_called_once_with(knowledge_id=1)
+        mock_del.assert_called_once_with(knowledge_ids=[1])
+
+    @patch("app_know.services.summary_service.delete_mapping_by_knowledge_ids")
+    @patch("app_know.services.summary_service.delete_by_knowledge_ids")
+    def test_delete_summaries_for_knowledges_batches(self, mock_del, mock_del_mapping):
+        """delete_summaries_for_knowledges issues one delete per DELETE_BATCH_SIZE ids and sums counts."""
+        mock_del.side_effect = lambda knowledge_ids: len(knowledge_ids)
+        ids = list(range(1, 2 * DELETE_BATCH_SIZE + 2))
+        svc = SummaryService()
+        n = svc.delete_summaries_for_knowledges(ids + [0, -1, None])
+        self.assertEqual(n, len(ids))
+        self.assertEqual(mock_del.call_count, 3)
+        self.assertEqual(mock_del.call_args_list[2][1]["knowledge_ids"], [2 * DELETE_BATCH_SIZE + 1])
+        self.assertEqual(mock_del_mapping.call_count, 3)
+
+    @patch("app_know.services.summary_service.delete_mapping_by_knowledge_ids")
+    @patch("app_know.services.summary_service.delete_by_knowledge_ids")
+    def test_delete_summaries_for_knowledges_mapping_failure_is_best_effort(self, mock_del, mock_del_mapping):
+        """A failed mapping delete is logged; later batches still run and the summary count is returned."""
+        mock_del.side_effect = lambda knowledge_ids: len(knowledge_ids)
+        mock_del_mapping.side_effect = RuntimeError("mapping write failed")
+        ids = list(range(1, DELETE_BATCH_SIZE + 2))
+        svc = SummaryService()
+        with self.assertLogs("app_know.services.summary_service", level="WARNING") as logs:
+            n = svc.delete_summaries_for_knowledges(ids)
+        self.assertEqual(n, len(ids))
+        self.assertEqual(mock_del.call_count, 2)
+        self.assertEqual(mock_del_mapping.call_count, 2)
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn("mapping write failed", logs.output[0])
 
     def test_delete_summaries_invalid_id_returns_zero(self):
         svc = SummaryService()
@@ -281,14 +328,10 @@ class SummaryServiceTest(TestCase):
 
     @patch("app_know.services.summary_service.create_or_update_mapping")
     @patch("app_know.services.summary_service.save_summary")
-    @patch("app_know.services.summary_service.get_knowledge_by_id")
-    def test_generate_and_save_creates_mapping(self, mock_get_know, mock_save, mock_mapping):
+    @patch("app_know.services.summary_service.get_knowledge_fields")
+    def test_generate_and_save_creates_mapping(self, mock_get_fields, mock_save, mock_mapping):
         """generate_and_save creates MySQL mapping after saving summary."""
-        mock_entity = MagicMock()
-        mock_entity.title = "Title"
-        mock_entity.description = "Desc"
-        mock_entity.source_type = "doc"
-        mock_get_know.return_value = mock_entity
+        mock_get_fields.return_value = ("Title", "Desc", "", "doc")
         mock_save.return_value = {
             "id": "65a1b2c3d4e5f6",
             "kid": 1,
@@ -304,18 +347,10 @@ class SummaryServiceTest(TestCase):
 
     @patch("app_aibroker.outbound_client.aibroker_ask_and_answer")
     @patch("app_know.services.summary_service.save_summary")
-    @patch("app_know.services.summary_service.get_batch_as_entity")
-    def test_generate_and_save_with_ai(self, mock_get_batch, mock_save, mock_ai):
+    @patch("app_know.services.summary_service.get_knowledge_fields")
+    def test_generate_and_save_with_ai(self, mock_get_fields, mock_save, mock_ai):
         """generate_and_save with use_ai=True calls save_summary with AI-generated summary."""
-        mock_get_batch.return_value = {
-            "id": 1,
-            "title": "Title",
-            "description": "Desc",
-            "content": "Content for summarization",
-            "source_type": "doc",
-            "ct": 0,
-            "ut": 0,
-        }
+        mock_get_fields.return_value = ("Title", "Desc", "Content for summarization", "doc")
         mock_ai.return_value = "AI summary"
         mock_save.return_value = {"kid": 1, "summary": "AI summary", "app_id": 1}
 
@@ -324,3 +359,95 @@ class SummaryServiceTest(TestCase):
         call_kw = mock_save.call_args[1]
         self.assertEqual(call_kw["summary"], "AI summary")
         self.assertNotIn("source", call_kw)
+
+    @patch("app_know.services.summary_service.generate_summary_with_source")
+    @patch("app_know.services.summary_service.save_summary")
+    @patch("app_know.services.summary_service.repo_get_summary")
+    @patch("app_know.services.summary_service.get_knowledge_fields")
+    def test_generate_and_save_unchanged_source_skips_generation(
+            self, mock_get_fields, mock_get_summary, mock_save, mock_generate):
+        """generate_and_save returns the existing summary when its content_hash matches the source."""
+        mock_get_fields.return_value = ("Title", "", "Body", "batch")
+        existing = {
+            "kid": 1,
+            "app_id": 1,
+            "summary": "S",
+            "content_hash": _content_hash("Title", "", "Body", "batch", SUMMARY_SOURCE_RULE),
+        }
+        mock_get_summary.return_value = existing
+
+        svc = SummaryService()
+        out = svc.generate_and_save(knowledge_id=1, app_id=1)
+        self.assertIs(out, existing)
+        mock_get_summary.assert_called_once_with(knowledge_id=1, app_id=1)
+        mock_generate.assert_not_called()
+        mock_save.assert_not_called()
+
+    @patch("app_know.services.summary_generator._generate_summary_with_ai")
+    @patch("app_know.services.summary_service.save_summary")
+    @patch("app_know.services.summary_service.repo_get_summary")
+    @patch("app_know.services.summary_service.get_knowledge_fields")
+    def test_generate_and_save_ai_fallback_is_not_reused(
+            self, mock_get_fields, mock_get_summary, mock_save, mock_ai):
+        """A rule-based fallback saved for a use_ai call does not satisfy the next use_ai call."""
+        mock_get_fields.return_value = ("Title", "", "Body", "batch")
+        mock_save.side_effect = lambda **kw: {"id": None, **kw}
+        svc = SummaryService()
+
+        mock_get_summary.return_value = None
+        mock_ai.return_value = None
+        fallback = svc.generate_and_save(knowledge_id=1, app_id=1, use_ai=True)
+        self.assertEqual(
+            fallback["content_hash"], _content_hash("Title", "", "Body", "batch", SUMMARY_SOURCE_RULE))
+
+        mock_get_summary.return_value = fallback
+        mock_ai.reset_mock()
+        mock_ai.return_value = "AI summary"
+        out = svc.generate_and_save(knowledge_id=1, app_id=1, use_ai=True)
+        mock_ai.assert_called_once()
+        self.assertEqual(out["summary"], "AI summary")
+        self.assertEqual(out["content_hash"], _content_hash("Title", "", "Body", "batch", SUMMARY_SOURCE_AI))
+
+    def test_content_hash_covers_generator_config(self):
+        """Changing the summary length cap or the AI question changes the hash of the affected path."""
+        args = ("Title", "", "Body", "batch")
+        rule_hash = _content_hash(*args, SUMMARY_SOURCE_RULE)
+        ai_hash = _content_hash(*args, SUMMARY_SOURCE_AI)
+        with patch("app_know.services.summary_service.SUMMARY_MAX_LEN", 500):
+            self.assertNotEqual(_content_hash(*args, SUMMARY_SOURCE_RULE), rule_hash)
+        with patch("app_know.services.summary_service.SUMMARY_QUESTION", "another question"):
+            self.assertNotEqual(_content_hash(*args, SUMMARY_SOURCE_AI), ai_hash)
+            self.assertEqual(_content_hash(*args, SUMMARY_SOURCE_RULE), rule_hash)
+
+    def test_generate_and_save_coalesces_concurrent_calls(self):
+        """A second generate_and_save for the same key waits for the in-flight call instead of regenerating."""
+        started = threading.Event()
+        follower_waiting = threading.Event()
+        release = threading.Event()
+
+        class _SignalingFuture(Future):
+            def result(self, timeout=None):
+                follower_waiting.set()
+                return super().result(timeout)
+
+        def _slow_generate(knowledge_id, app_id, use_ai):
+            started.set()
+            release.wait(5)
+            return {"kid": knowledge_id, "app_id": app_id}
+
+        svc = SummaryService()
+        results = []
+        with patch("app_know.services.summary_service.Future", _SignalingFuture), \
+                patch.object(SummaryService, "_generate_and_save", side_effect=_slow_generate) as mock_generate:
+            leader = threading.Thread(target=lambda: results.append(svc.generate_and_save(1, 1)))
+            follower = threading.Thread(target=lambda: results.append(svc.generate_and_save(1, "1")))
+            leader.start()
+            self.assertTrue(started.wait(5))
+            follower.start()
+            self.assertTrue(follower_waiting.wait(5))
+            release.set()
+            leader.join(5)
+            follower.join(5)
+        self.assertEqual(mock_generate.call_count, 1)
+        self.assertEqual(results, [{"kid": 1, "app_id": 1}, {"kid": 1, "app_id": 1}])
+        self.assertEqual(svc._inflight, {})
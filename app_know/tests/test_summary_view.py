@@ -1,7 +1,6 @@
 """
 Tests for knowledge summary API views (validation, error handling, edge cases). Generated.
 """
-import json
 from django.test import TestCase
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
@@ -44,8 +43,7 @@ class KnowledgeSummaryViewTest(TestCase):
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["data"]["app_id"], "myapp")
         mock_svc.generate_and_save.assert_called_once_with(
@@ -59,8 +57,7 @@ class KnowledgeSummaryViewTest(TestCase):
             format="json",
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     def test_post_invalid_entity_id(self):
@@ -70,23 +67,20 @@ class KnowledgeSummaryViewTest(TestCase):
             format="json",
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=0)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_get_invalid_entity_id_non_integer(self):
         request = self.factory.get("/api/know/knowledge/abc/summary")
         response = KnowledgeSummaryView.as_view()(request, entity_id="abc")
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertNotEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
     def test_get_invalid_entity_id_empty(self):
         request = self.factory.get("/api/know/knowledge//summary")
         response = KnowledgeSummaryView.as_view()(request, entity_id="")
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertNotEqual(data["errorCode"], RET_OK)
 
     @patch("app_know.views.summary_view.SummaryService")
@@ -102,8 +96,7 @@ class KnowledgeSummaryViewTest(TestCase):
         request = self.factory.get(f"/api/know/knowledge/{self.entity_id}/summary")
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["data"]["summary"], "A summary")
 
@@ -115,8 +108,7 @@ class KnowledgeSummaryViewTest(TestCase):
 
         request = self.factory.get(f"/api/know/knowledge/{self.entity_id}/summary")
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_RESOURCE_NOT_FOUND)
 
     @patch("app_know.views.summary_view.SummaryService")
@@ -135,8 +127,7 @@ class KnowledgeSummaryViewTest(TestCase):
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         mock_svc.generate_and_save.assert_called_once_with(
             knowledge_id=self.entity_id, app_id="42", use_ai=False
@@ -150,8 +141,7 @@ class KnowledgeSummaryViewTest(TestCase):
             content_type="application/json",
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertNotEqual(data["errorCode"], RET_OK)
 
     def test_post_app_id_whitespace_only_returns_validation_error(self):
@@ -162,8 +152,7 @@ class KnowledgeSummaryViewTest(TestCase):
             format="json",
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
 
@@ -186,41 +175,24 @@ class KnowledgeSummaryListViewTest(TestCase):
         request = self.factory.get("/api/know/knowledge/summaries", {"limit": 10, "offset": 0})
         response = KnowledgeSummaryListView.as_view()(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["data"]["total_num"], 1)
         self.assertEqual(len(data["data"]["data"]), 1)
 
-    def test_list_validation_invalid_limit(self):
-        request = self.factory.get("/api/know/knowledge/summaries", {"limit": -1})
-        response = KnowledgeSummaryListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
-        self.assertNotEqual(data["errorCode"], RET_OK)
-
-    def test_list_validation_limit_zero(self):
-        request = self.factory.get("/api/know/knowledge/summaries", {"limit": 0})
-        response = KnowledgeSummaryListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
-        self.assertNotEqual(data["errorCode"], RET_OK)
-
-    def test_list_validation_offset_negative(self):
-        request = self.factory.get("/api/know/knowledge/summaries", {"offset": -1})
-        response = KnowledgeSummaryListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
-        self.assertNotEqual(data["errorCode"], RET_OK)
-
-    def test_list_validation_limit_over_max(self):
-        request = self.factory.get(
-            "/api/know/knowledge/summaries", {"limit": LIMIT_LIST + 1}
-        )
-        response = KnowledgeSummaryListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
-        self.assertNotEqual(data["errorCode"], RET_OK)
+    def test_list_validation(self):
+        cases = [
+            {"limit": -1},
+            {"limit": 0},
+            {"offset": -1},
+            {"limit": LIMIT_LIST + 1},
+        ]
+        for params in cases:
+            with self.subTest(**params):
+                request = self.factory.get("/api/know/knowledge/summaries", params)
+                response = KnowledgeSummaryListView.as_view()(request)
+                data = response.data
+                self.assertNotEqual(data["errorCode"], RET_OK)
 
     @patch("app_know.views.summary_view.SummaryService")
     def test_list_invalid_knowledge_id_ignored_filter(self, mock_svc_cls):
@@ -238,8 +210,7 @@ class KnowledgeSummaryListViewTest(TestCase):
         )
         response = KnowledgeSummaryListView.as_view()(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         mock_svc.list_summaries.assert_called_once()
         call_kw = mock_svc.list_summaries.call_args[1]
@@ -252,8 +223,7 @@ class KnowledgeSummaryListViewTest(TestCase):
             {"offset": "abc", "limit": "10"},
         )
         response = KnowledgeSummaryListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertNotEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
@@ -264,8 +234,7 @@ class KnowledgeSummaryListViewTest(TestCase):
             {"offset": "0", "limit": "xyz"},
         )
         response = KnowledgeSummaryListView.as_view()(request)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertNotEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["errorCode"], RET_INVALID_PARAM)
 
@@ -294,8 +263,7 @@ class KnowledgeSummaryViewMockedTest(TestCase):
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         mock_svc.generate_and_save.assert_called_once_with(
             knowledge_id=self.entity_id, app_id="myapp", use_ai=True
@@ -318,8 +286,7 @@ class KnowledgeSummaryViewMockedTest(TestCase):
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
         self.assertEqual(data["data"]["summary"], "Updated summary")
 
@@ -331,8 +298,7 @@ class KnowledgeSummaryViewMockedTest(TestCase):
             format="json",
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     @patch("app_know.views.summary_view.SummaryService")
@@ -347,8 +313,7 @@ class KnowledgeSummaryViewMockedTest(TestCase):
             format="json",
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_RESOURCE_NOT_FOUND)
 
     @patch("app_know.views.summary_view.SummaryService")
@@ -362,8 +327,7 @@ class KnowledgeSummaryViewMockedTest(TestCase):
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_OK)
 
     def test_delete_missing_app_id_returns_validation_error(self):
@@ -372,8 +336,7 @@ class KnowledgeSummaryViewMockedTest(TestCase):
             f"/api/know/knowledge/{self.entity_id}/summary"
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_MISSING_PARAM)
 
     @patch("app_know.views.summary_view.SummaryService")
@@ -386,6 +349,5 @@ class KnowledgeSummaryViewMockedTest(TestCase):
             f"/api/know/knowledge/{self.entity_id}/summary?app_id=myapp"
         )
         response = KnowledgeSummaryView.as_view()(request, entity_id=self.entity_id)
-        response.render()
-        data = json.loads(response.content)
+        data = response.data
         self.assertEqual(data["errorCode"], RET_RESOURCE_NOT_FOUND)
@@ -1,24 +1,41 @@
+import os
+import unittest
+from types import SimpleNamespace
 from unittest import TestCase
+from unittest.mock import DEFAULT, Mock, patch
 
+from py2neo import Graph, Node, NodeMatcher, Relationship, RelationshipMatcher
+
+from common.components.singleton import _Singleton
+from common.drivers import neo4j_driver as _neo4j_driver_mod
 from common.drivers.neo4j_driver import Neo4jDriver
 
+# Integration tests require a running Neo4j; skip unless explicitly enabled.
+RUN_NEO4J_INTEGRATION = os.environ.get("RUN_NEO4J_INTEGRATION_TESTS", "").lower() in ("1", "true", "yes")
+
 
+@unittest.skipUnless(RUN_NEO4J_INTEGRATION, "Neo4j integration tests disabled (set RUN_NEO4J_INTEGRATION_TESTS=1 to run)")
 class TestNeo4jDriver(TestCase):
-    def setUp(self):
-        self.dut = Neo4jDriver('bolt://127.0.0.1:7687', 'neo4j', '9TRagjq8SGPDvhV')
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.dut = Neo4jDriver('bolt://127.0.0.1:7687', 'neo4j', '9TRagjq8SGPDvhV')
 
     def test_run(self):
         # 测试连接
-        try:
-            self.dut.run("MATCH (n) RETURN n LIMIT 1")
-        except Exception as e:
-            print(f"Connection failed: {e}")
+        result = self.dut.run("RETURN 1 AS ok")
+        self.assertEqual(result.evaluate(), 1)
 
     def test_create_node(self):
         # 测试创建节点
         node = self.dut.create_node("Person", {"name": "Alice", "age": 30})
         self.assertIsNotNone(node)
 
+    def test_create_node_list(self):
+        # 测试批量创建节点
+        node_list = self.dut.create_node_list("Person", [{"name": "Carol"}, {"name": "Dave"}])
+        self.assertEqual(len(node_list), 2)
+
     def test_create_edge(self):
         # 测试创建关系
         start_node = self.dut.create_node("company", {"name": "Alice"})
@@ -70,3 +87,104 @@ class TestNeo4jDriver(TestCase):
     def test_delete_all(self):
         # 测试删除所有节点和关系
         self.dut.delete_all()
+
+
+class TestNeo4jDriverMocked(TestCase):
+    """Neo4jDriver against patched py2neo Graph and matchers; no server required."""
+
+    URI = "bolt://localhost:7687"
+    USER = "neo4j"
+    PASSWORD = "pass"
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Started once per class; setUp only resets the recorded calls
+        patcher = patch.multiple(_neo4j_driver_mod, Graph=DEFAULT, NodeMatcher=DEFAULT, RelationshipMatcher=DEFAULT)
+        mocks = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        cls.mock_graph_cls = mocks["Graph"]
+        cls.mock_node_matcher_cls = mocks["NodeMatcher"]
+        cls.mock_rel_matcher_cls = mocks["RelationshipMatcher"]
+
+    def setUp(self):
+        for mock_cls in (self.mock_graph_cls, self.mock_node_matcher_cls, self.mock_rel_matcher_cls):
+            mock_cls.reset_mock(return_value=True, side_effect=True)
+        # Spec'd against py2neo so calling a method it does not have fails instead of passing silently
+        self.mock_graph = self.mock_graph_cls.return_value = Mock(spec=Graph)
+        self.mock_node_matcher = self.mock_node_matcher_cls.return_value = Mock(spec=NodeMatcher)
+        self.mock_rel_matcher = self.mock_rel_matcher_cls.return_value = Mock(spec=RelationshipMatcher)
+        self.dut = Neo4jDriver(self.URI, self.USER, self.PASSWORD)
+
+    def tearDown(self):
+        _Singleton._instances.pop(Neo4jDriver, None)
+
+    def test_init_wires_graph_and_matcher(self):
+        self.mock_graph_cls.assert_called_once_with(self.URI, auth=(self.USER, self.PASSWORD), name="neo4j")
+        self.mock_rel_matcher_cls.assert_called_once_with(self.mock_graph)
+
+    def test_create_node(self):
+        node = self.dut.create_node("Person", {"name": "Alice", "age": 30})
+        self.assertTrue(node.has_label("Person"))
+        self.assertEqual(dict(node), {"name": "Alice", "age": 30})
+        self.mock_graph.create.assert_called_once_with(node)
+
+    def test_create_node_list_uses_single_unwind(self):
+        rows = [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
+        created = [Node("Person", **row) for row in rows]
+        self.mock_graph.run.return_value = [[node] for node in created]
+        self.assertEqual(self.dut.create_node_list("Person", rows), created)
+        self.mock_graph.run.assert_called_once_with(
+            "UNWIND $rows AS row CREATE (n:Person) SET n = row RETURN n", {"rows": rows})
+        self.mock_graph.create.assert_not_called()
+
+    def test_create_node_list_empty_skips_round_trip(self):
+        self.assertEqual(self.dut.create_node_list("Person", []), [])
+        self.mock_graph.run.assert_not_called()
+
+    def test_create_edge(self):
+        start_node = Node("company", name="google")
+        end_node = Node("business", name="internet advertising")
+        edge = self.dut.create_edge(start_node, end_node, "BELONG_TO")
+        self.assertEqual(type(edge).__name__, "BELONG_TO")
+        self.assertEqual((edge.start_node, edge.end_node), (start_node, end_node))
+        self.mock_graph.create.assert_called_once_with(edge)
+
+    def test_update_pushes_properties(self):
+        alice = Node("Person", name="Alice")
+        cases = [
+            ("update_node", alice),
+            ("update_edge", Relationship(alice, "KNOWS", Node("Person", name="Bob"))),
+        ]
+        for method, entity in cases:
+            with self.subTest(method=method):
+                self.mock_graph.push.reset_mock()
+                getattr(self.dut, method)(entity, {"since": 2020})
+                self.assertEqual(entity["since"], 2020)
+                self.mock_graph.push.assert_called_once_with(entity)
+
+    def test_find_node(self):
+        found = self.mock_node_matcher.match.return_value.first.return_value
+        self.assertIs(self.dut.find_node("company", {"name": "google"}), found)
+        self.mock_node_matcher.match.assert_called_once_with("company", name="google")
+
+    def test_find_linked_node_lists(self):
+        node = Node("business", name="internet advertising")
+        edges = [
+            SimpleNamespace(start_node="google", end_node="ads"),
+            SimpleNamespace(start_node="baidu", end_node="search"),
+        ]
+        self.mock_rel_matcher.match.return_value.limit.return_value = edges
+        cases = [
+            ("find_src_list_from_dest", [None, node], ["google", "baidu"]),
+            ("find_dest_list_from_src", [node, None], ["ads", "search"]),
+        ]
+        for method, nodes, expected in cases:
+            with self.subTest(method=method):
+                self.mock_rel_matcher.match.reset_mock()
+                self.assertEqual(getattr(self.dut, method)(node, "BELONG_TO"), expected)
+                self.mock_rel_matcher.match.assert_called_once_with(nodes=nodes, r_type="BELONG_TO")
+
+    def test_run_defaults_parameters(self):
+        self.dut.run("MATCH (n) RETURN n LIMIT 1")
+        self.mock_graph.run.assert_called_once_with("MATCH (n) RETURN n LIMIT 1", {})